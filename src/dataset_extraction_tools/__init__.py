@@ -4,28 +4,42 @@ Extract datasets from documents: Document -> Markdown -> Structured Data with Ev
 """
 
 # Core conversion and extraction
-from .convert import convert_to_markdown
+from .convert import convert_to_markdown, convert_to_markdown_async, convert_many
 from .extract import (
-    extract_from_text, extract_from_file, extract_from_files,
+    extract_from_text, extract_from_text_async, extract_from_file, extract_from_files,
     WithEvidence, StringWithEvidence, IntWithEvidence, 
     FloatWithEvidence, DateWithEvidence, EnumWithEvidence
 )
 
 # Batch processing
 from .core import (
-    convert_dir, extract_dir
+    convert_dir, extract_dir, extract_dir_batched, extract_dir_async,
+    process_dir_streaming, load_dir, status_dir, clean_dir
 )
 
+# Column-oriented results
+from .batch import EvidenceBatch
+
+# Utils
+from .utils import find_files
+
 __all__ = [
     # Single document processing
     "convert_to_markdown",
+    "convert_to_markdown_async",
+    "convert_many",
     "extract_from_text", 
+    "extract_from_text_async",
     "extract_from_file",
     "extract_from_files",
     
     # Batch processing
     "convert_dir",
     "extract_dir", 
+    "extract_dir_batched",
+    "extract_dir_async",
+    "process_dir_streaming",
+    "load_dir",
     
     # Evidence models
     "WithEvidence",
@@ -34,6 +48,7 @@ __all__ = [
     "FloatWithEvidence",
     "DateWithEvidence",
     "EnumWithEvidence",
+    "EvidenceBatch",
 
     # Utils
     "find_files",
@@ -0,0 +1,122 @@
+"""
+Column-oriented containers for many extraction results.
+
+A list of models stores each document's fields together; analytics over one
+field (mean confidence, filtering, export) then walk every model. EvidenceBatch
+flattens results once into one value list and one float32 confidence array per
+field, so column scans are contiguous numpy operations.
+"""
+
+from functools import cached_property
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+import numpy as np
+from pydantic import BaseModel
+from .extract import WithEvidence
+
+__all__ = ["EvidenceBatch"]
+
+
+class EvidenceBatch:
+    """Structure-of-arrays view of extraction results.
+
+    Attributes:
+        keys: One key per document (e.g. JSON path from load_dir, or index)
+        values: Field name -> list of extracted values (None when missing)
+        confidences: Field name -> float32 array of confidences (NaN when the
+                     field has no evidence, e.g. results from the fallback schema)
+
+    Derived statistics (overall_confidence, fields_extracted) are computed on
+    first access and cached, so the columns should not be modified afterwards.
+    """
+
+    def __init__(self, keys: List[str], values: Dict[str, list], confidences: Dict[str, np.ndarray]):
+        self.keys = keys
+        self.values = values
+        self.confidences = confidences
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_models(cls, results: Union[Mapping[str, BaseModel], Sequence[BaseModel]]) -> "EvidenceBatch":
+        """Flatten models (a list, or a dict such as load_dir's result) into columns."""
+        if isinstance(results, Mapping):
+            keys, models = list(results.keys()), list(results.values())
+        else:
+            keys, models = [str(i) for i in range(len(results))], list(results)
+
+        # Union of fields over every model class in the batch, in declaration order
+        field_names = list(dict.fromkeys(
+            name for model_class in dict.fromkeys(type(m) for m in models) for name in model_class.model_fields
+        ))
+
+        values = {name: [None] * len(models) for name in field_names}
+        confidences = {name: np.full(len(models), np.nan, dtype=np.float32) for name in field_names}
+
+        for i, model in enumerate(models):
+            for name in field_names:
+                field = getattr(model, name, None)
+                if isinstance(field, WithEvidence):
+                    values[name][i] = field.value
+                    confidences[name][i] = field.confidence
+                else:
+                    values[name][i] = field
+
+        return cls(keys, values, confidences)
+
+    def confidence_matrix(self) -> np.ndarray:
+        """Return an (N documents, F fields) float32 array of confidences, fields in `values` order."""
+        if not self.confidences:
+            return np.empty((len(self), 0), dtype=np.float32)
+        return np.column_stack(list(self.confidences.values()))
+
+    def confidence_stats(self) -> Tuple[np.ndarray, Dict[str, float]]:
+        """Return the cached (overall_confidence, per-field mean confidence) pair."""
+        return self._confidence_means
+
+    @property
+    def overall_confidence(self) -> np.ndarray:
+        """Mean confidence per document (float32, NaN when it has no evidence fields)."""
+        return self._confidence_means[0]
+
+    @cached_property
+    def fields_extracted(self) -> np.ndarray:
+        """Number of fields with a non-None value per document."""
+        counts = np.zeros(len(self), dtype=np.int32)
+        for column in self.values.values():
+            counts += np.fromiter((value is not None for value in column), dtype=bool, count=len(self))
+        return counts
+
+    def needs_review(self, threshold: float = 0.5) -> np.ndarray:
+        """Boolean mask of documents whose overall confidence is below threshold or unknown."""
+        return ~(self.overall_confidence >= threshold)
+
+    @cached_property
+    def _confidence_means(self) -> Tuple[np.ndarray, Dict[str, float]]:
+        """
+        Compute mean confidence per document and per field in one vectorized pass.
+
+        NaN entries (fields without evidence) are ignored; a document or field
+        with no confidences at all gets NaN.
+
+        Returns:
+            Tuple of (float32 array with one overall confidence per document,
+                      dict mapping field name to its mean confidence)
+        """
+        matrix = self.confidence_matrix()
+        present = ~np.isnan(matrix)
+        filled = np.where(present, matrix, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            per_document = filled.sum(axis=1) / present.sum(axis=1)
+            per_field = filled.sum(axis=0) / present.sum(axis=0)
+        return per_document.astype(np.float32), dict(zip(self.confidences, per_field.tolist()))
+
+    def to_dataframe(self):
+        """Return a pandas DataFrame indexed by key, with `<field>` and `<field>_confidence` columns."""
+        import pandas as pd
+
+        columns = {}
+        for name, column in self.values.items():
+            columns[name] = column
+            columns[f"{name}_confidence"] = self.confidences[name]
+        return pd.DataFrame(columns, index=pd.Index(self.keys, name="key"))
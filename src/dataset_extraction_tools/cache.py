@@ -0,0 +1,58 @@
+"""
+Content-addressable on-disk cache for LLM extraction results and conversions.
+
+Entries are keyed by a SHA-256 over length-prefixed parts (provider, prompt
+version, prompt, document text; or file hash and converter options for
+conversions), so any change to the inputs misses the cache.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Union, Optional, Dict, Any
+from .utils import write_atomic, json_dumps, json_loads
+
+__all__ = ["cache_key", "read_entry", "write_entry", "evict_entry"]
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(*parts: Union[str, bytes]) -> str:
+    """Hash parts with an 8-byte length prefix each so boundaries are unambiguous."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(len(part).to_bytes(8, 'little'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def read_entry(cache_dir: Union[str, Path], key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached entry for key, or None if missing or unreadable."""
+    entry_path = Path(cache_dir) / f"{key}.json"
+    try:
+        return json_loads(entry_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {entry_path}: {e}")
+        return None
+
+
+def write_entry(cache_dir: Union[str, Path], key: str, config: Dict[str, Any], data: Any) -> None:
+    """Store data under key together with the config that produced it."""
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "config": config,
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "data": data
+    }
+    write_atomic(cache_dir / f"{key}.json", json_dumps(entry, indent=False))
+
+
+def evict_entry(cache_dir: Union[str, Path], key: str) -> None:
+    """Remove the cached entry for key if present."""
+    (Path(cache_dir) / f"{key}.json").unlink(missing_ok=True)
@@ -6,10 +6,28 @@ Two-stage processing:
 2. Markdown -> Structured Data (via Instructor)
 """
 
+import asyncio
+import atexit
+import base64
+import hashlib
+import importlib.util
+import multiprocessing
+import os
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional, List, Iterable
 import logging
-from .utils import timing
+from .cache import cache_key, read_entry, write_entry
+from .utils import timing, json_dumps, json_loads
+
+__all__ = ["convert_to_markdown", "convert_to_markdown_async", "convert_many"]
 
 try:
     import pypandoc
@@ -17,13 +35,10 @@ try:
 except ImportError:
     PANDOC_AVAILABLE = False
 
-try:
-    from marker.converters.pdf import PdfConverter
-    from marker.models import create_model_dict
-    from marker.config.parser import ConfigParser
-    MARKER_AVAILABLE = True
-except ImportError:
-    MARKER_AVAILABLE = False
+# Marker is imported lazily (see _get_marker_converter) so Pandoc-only runs
+# never pay its import and model-loading cost
+MARKER_AVAILABLE = importlib.util.find_spec("marker") is not None
+_MARKER_LOCK = threading.Lock()
 
 try:
     from docling.document_converter import DocumentConverter
@@ -31,10 +46,38 @@ try:
 except ImportError:
     DOCLING_AVAILABLE = False
 
-_EXTENSIONS_NOT_SUPPORTED_BY_PANDOC = {'.pdf', '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'}
+try:
+    from pypdf import PdfReader, PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+_EXTENSIONS_NOT_SUPPORTED_BY_PANDOC = frozenset({'.pdf', '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'})
+
+# Worker processes are spawned rather than forked: callers run thread pools
+# alongside them, and a forked child could inherit a held lock such as _MARKER_LOCK
+_SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+# PDFs longer than this are split into page ranges when marker_workers > 1
+_MARKER_CHUNK_THRESHOLD = 100
+_MARKER_PAGES_PER_CHUNK = 25
+
+# Seconds a single Pandoc server conversion may take, on both the server and the client
+_PANDOC_SERVER_TIMEOUT = 60
+
+# Input formats accepted by the persistent Pandoc server; binary ones are sent base64-encoded
+_PANDOC_SERVER_FORMATS = {
+    '.docx': 'docx', '.odt': 'odt', '.epub': 'epub', '.html': 'html', '.htm': 'html',
+    '.rtf': 'rtf', '.rst': 'rst', '.tex': 'latex', '.org': 'org', '.md': 'markdown', '.txt': 'markdown'
+}
+_PANDOC_BINARY_FORMATS = frozenset({'docx', 'odt', 'epub'})
+
+_pandoc_server_url = None
+_pandoc_server_failed = False
+_pandoc_server_lock = threading.Lock()
 
 @timing
-def convert_to_markdown(file_path: Union[str, Path], use_marker: bool = False, use_docling: bool = False, **converter_kwargs) -> str:
+def convert_to_markdown(file_path: Union[str, Path], use_marker: bool = False, use_docling: bool = False, marker_workers: int = 1, use_pandoc_server: bool = False, cache_dir: Optional[Union[str, Path]] = None, **converter_kwargs) -> str:
     """
     Convert document to markdown using Pandoc first, Marker/Docling fallback.
 
@@ -42,6 +85,12 @@ def convert_to_markdown(file_path: Union[str, Path], use_marker: bool = False, u
         file_path: Path to document file
         use_marker: Force usage of Marker instead of Pandoc
         use_docling: Force usage of Docling instead of Pandoc
+        marker_workers: Marker processes for long PDFs; above 1, PDFs longer
+                        than 100 pages are split into page ranges converted in parallel
+        use_pandoc_server: Send Pandoc conversions to a persistent local
+                           `pandoc server` instead of spawning pandoc per file
+        cache_dir: Directory for cached conversions keyed by the file's SHA-256
+                   and the converter options; unchanged files skip conversion
 
     Returns:
         Markdown content as string
@@ -54,7 +103,58 @@ def convert_to_markdown(file_path: Union[str, Path], use_marker: bool = False, u
     
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
-    
+
+    if cache_dir is None:
+        return _convert(file_path, use_marker, use_docling, marker_workers, use_pandoc_server, **converter_kwargs)
+
+    # The Pandoc transport and the exact worker count do not change the output, but
+    # chunked Marker runs (marker_workers > 1) join per-chunk markdown, so that is keyed;
+    # keys are sorted so the same options passed in any order hit the same entry
+    config = dict(sorted({
+        "use_marker": use_marker, "use_docling": use_docling, "chunked": marker_workers > 1, **converter_kwargs
+    }.items()))
+    key = cache_key("convert", _file_sha256(file_path), json_dumps(config, indent=False))
+    entry = read_entry(cache_dir, key)
+    if entry is not None and isinstance(entry.get("data"), str):
+        return entry["data"]
+
+    markdown = _convert(file_path, use_marker, use_docling, marker_workers, use_pandoc_server, **converter_kwargs)
+    write_entry(cache_dir, key, {"file": file_path.name, **config}, markdown)
+    return markdown
+
+
+async def convert_to_markdown_async(file_path: Union[str, Path], **kwargs) -> str:
+    """Async variant of convert_to_markdown; runs the blocking conversion in a worker thread."""
+    return await asyncio.to_thread(convert_to_markdown, file_path, **kwargs)
+
+
+async def convert_many(
+    paths: Iterable[Union[str, Path]],
+    concurrency: int = 8,
+    **kwargs
+) -> List[Union[str, BaseException]]:
+    """
+    Convert several documents concurrently, at most `concurrency` at a time.
+
+    Useful when conversion waits on Pandoc (subprocesses or the Pandoc server).
+    Marker conversions, including use_llm ones, share one converter per process
+    behind a lock and still run one file at a time; use convert_dir's process
+    pool to run Marker in parallel.
+
+    Returns:
+        Markdown for each path in input order, or the exception its conversion raised
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def convert(path: Union[str, Path]) -> str:
+        async with semaphore:
+            return await convert_to_markdown_async(path, **kwargs)
+
+    return await asyncio.gather(*[convert(path) for path in paths], return_exceptions=True)
+
+
+def _convert(file_path: Path, use_marker: bool, use_docling: bool, marker_workers: int, use_pandoc_server: bool, **converter_kwargs) -> str:
+    """Dispatch file_path to Docling, Marker or Pandoc."""
     file_ext = file_path.suffix.lower()
 
     # Force Docling usage if requested
@@ -63,24 +163,48 @@ def convert_to_markdown(file_path: Union[str, Path], use_marker: bool = False, u
 
     # Force Marker usage if requested
     if use_marker:
-        return _convert_with_marker(file_path, **converter_kwargs)
+        return _convert_with_marker_auto(file_path, marker_workers, **converter_kwargs)
     
     # PDF and image formats -> Marker
     if file_ext in _EXTENSIONS_NOT_SUPPORTED_BY_PANDOC:
-        return _convert_with_marker(file_path, **converter_kwargs)
+        return _convert_with_marker_auto(file_path, marker_workers, **converter_kwargs)
     
     # Text formats -> Pandoc first, Marker fallback
     try:
-        return _convert_with_pandoc(file_path)
+        return _convert_with_pandoc(file_path, use_server=use_pandoc_server)
     except Exception as e:
         logging.warning(f"Pandoc failed: {e}, trying Marker")
         return _convert_with_marker(file_path, **converter_kwargs)
 
 
-def _convert_with_pandoc(file_path: Path) -> str:
+def _file_sha256(file_path: Path) -> str:
+    """Hash file contents, memoized while the file's size and mtime are unchanged."""
+    stat = file_path.stat()
+    return _file_sha256_cached(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _file_sha256_cached(path: str, mtime_ns: int, size: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(partial(f.read, 1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _convert_with_pandoc(file_path: Path, use_server: bool = False) -> str:
     """Convert using Pandoc."""
     if not PANDOC_AVAILABLE:
         raise RuntimeError("pypandoc not available. Install with: pip install pypandoc-binary")
+
+    input_format = _PANDOC_SERVER_FORMATS.get(file_path.suffix.lower())
+    if use_server and input_format is not None:
+        url = _get_pandoc_server_url()
+        if url is not None:
+            try:
+                return _convert_with_pandoc_server(url, file_path, input_format)
+            except Exception as e:
+                logging.warning(f"Pandoc server failed: {e}, running pandoc directly")
     
     return pypandoc.convert_file(
         str(file_path),
@@ -89,6 +213,93 @@ def _convert_with_pandoc(file_path: Path) -> str:
     )
 
 
+def _convert_with_pandoc_server(url: str, file_path: Path, input_format: str) -> str:
+    """Convert one file through the running Pandoc server."""
+    content = file_path.read_bytes()
+    if input_format in _PANDOC_BINARY_FORMATS:
+        text = base64.b64encode(content).decode('ascii')
+    else:
+        text = content.decode('utf-8')
+
+    payload = {"text": text, "from": input_format, "to": "markdown", "wrap": "none"}
+    request = urllib.request.Request(
+        url,
+        data=json_dumps(payload, indent=False),
+        headers={"Content-Type": "application/json", "Accept": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=_PANDOC_SERVER_TIMEOUT) as response:
+        result = json_loads(response.read())
+
+    if result.get("base64"):
+        raise RuntimeError("Pandoc server returned binary output")
+    return result["output"]
+
+
+def _get_pandoc_server_url() -> Optional[str]:
+    """Start `pandoc server` on a free loopback port once per process; None if unavailable."""
+    global _pandoc_server_url, _pandoc_server_failed
+
+    with _pandoc_server_lock:
+        if _pandoc_server_url is not None or _pandoc_server_failed:
+            return _pandoc_server_url
+
+        try:
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+
+            process = subprocess.Popen(
+                # pandoc server cancels conversions after 2 s by default; match the client timeout
+                [pypandoc.get_pandoc_path(), "server", "--port", str(port), "--timeout", str(_PANDOC_SERVER_TIMEOUT)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            atexit.register(process.terminate)
+
+            deadline = time.monotonic() + 5
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"pandoc server exited with code {process.returncode}")
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        process.terminate()
+                        raise RuntimeError("pandoc server did not start")
+                    time.sleep(0.05)
+        except Exception as e:
+            logging.warning(f"Pandoc server unavailable: {e}, running pandoc per file")
+            _pandoc_server_failed = True
+            return None
+
+        _pandoc_server_url = f"http://127.0.0.1:{port}"
+        return _pandoc_server_url
+
+
+@lru_cache(maxsize=1)
+def _get_marker_models() -> dict:
+    """Load Marker's ML models once per process."""
+    from marker.models import create_model_dict
+    return create_model_dict()
+
+
+@lru_cache(maxsize=4)
+def _get_marker_converter(config_key: tuple):
+    """Build a Marker PdfConverter for a frozen config, reused across files."""
+    from marker.converters.pdf import PdfConverter
+    from marker.config.parser import ConfigParser
+
+    config_parser = ConfigParser(dict(config_key))
+    return PdfConverter(
+        config=config_parser.generate_config_dict(),
+        artifact_dict=_get_marker_models(),
+        processor_list=config_parser.get_processors(),
+        renderer=config_parser.get_renderer(),
+        llm_service=config_parser.get_llm_service()
+    )
+
+
 def _convert_with_marker(file_path: Path, **kwargs) -> str:
     """Convert using Marker."""
     if not MARKER_AVAILABLE:
@@ -102,17 +313,17 @@ def _convert_with_marker(file_path: Path, **kwargs) -> str:
     # Update with provided kwargs
     config = {**defaults, **kwargs}
 
-    config_parser = ConfigParser(config)
-    converter = PdfConverter(
-        config=config_parser.generate_config_dict(),
-        artifact_dict=create_model_dict(),
-        processor_list=config_parser.get_processors(),
-        renderer=config_parser.get_renderer(),
-        llm_service=config_parser.get_llm_service()
-    )
-    
-    # Convert document
-    rendered = converter(str(file_path))
+    config_key = tuple(sorted(config.items()))
+
+    # Converters are cached per config and shared between threads, so both
+    # construction and inference are serialized
+    with _MARKER_LOCK:
+        try:
+            converter = _get_marker_converter(config_key)
+        except TypeError:
+            # Unhashable config values: build an uncached converter
+            converter = _get_marker_converter.__wrapped__(config_key)
+        rendered = converter(str(file_path))
     
     if not rendered or not hasattr(rendered, 'markdown'):
         raise RuntimeError("Marker conversion failed")
@@ -120,6 +331,48 @@ def _convert_with_marker(file_path: Path, **kwargs) -> str:
     return rendered.markdown
 
 
+def _convert_with_marker_auto(file_path: Path, marker_workers: int, **kwargs) -> str:
+    """Convert using Marker, chunking long PDFs across worker processes."""
+    if marker_workers > 1 and file_path.suffix.lower() == '.pdf' and PYPDF_AVAILABLE:
+        reader = PdfReader(str(file_path))
+        if len(reader.pages) > _MARKER_CHUNK_THRESHOLD:
+            return _convert_with_marker_chunked(reader, file_path.stem, workers=marker_workers, **kwargs)
+    return _convert_with_marker(file_path, **kwargs)
+
+
+def _convert_with_marker_chunked(
+    reader: "PdfReader",
+    stem: str,
+    pages_per_chunk: int = _MARKER_PAGES_PER_CHUNK,
+    workers: Optional[int] = None,
+    **kwargs
+) -> str:
+    """Convert a PDF as page-range chunks in parallel Marker processes, joined in page order."""
+    n_pages = len(reader.pages)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        chunk_paths = []
+        for start in range(0, n_pages, pages_per_chunk):
+            writer = PdfWriter()
+            for page in reader.pages[start:start + pages_per_chunk]:
+                writer.add_page(page)
+            chunk_path = Path(tmp_dir) / f"{stem}_{start:06d}.pdf"
+            with open(chunk_path, 'wb') as f:
+                writer.write(f)
+            chunk_paths.append(chunk_path)
+
+        logging.info(f"Converting {n_pages} pages as {len(chunk_paths)} chunks")
+        with _process_pool(workers or os.cpu_count()) as pool:
+            pieces = list(pool.map(partial(_convert_with_marker, **kwargs), chunk_paths))
+
+    return "\n\n".join(pieces)
+
+
+def _process_pool(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """Return a process pool whose workers are spawned, never forked from a threaded parent."""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=_SPAWN_CONTEXT)
+
+
 def _convert_with_docling(file_path: Path, **kwargs) -> str:
     """Convert using Docling."""
     if not DOCLING_AVAILABLE:
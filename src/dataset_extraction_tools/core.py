@@ -3,12 +3,28 @@ Simplified batch processing pipeline for document conversion and extraction.
 Consolidates all batch operations with unified file discovery and error handling.
 """
 
+import asyncio
 import logging
+import os
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Union, Optional, Type, Dict, List
-from .convert import convert_to_markdown, _EXTENSIONS_NOT_SUPPORTED_BY_PANDOC
-from .extract import extract_from_file, T
-from .utils import timing, find_files
+from typing import (
+    Union, Optional, Type, Dict, List, Set, Tuple, Literal, Any, Iterable, Iterator, get_args, get_origin
+)
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from .convert import convert_to_markdown, _EXTENSIONS_NOT_SUPPORTED_BY_PANDOC, _process_pool
+from .extract import (
+    extract_from_file, extract_from_text, extract_from_text_async, extract_batch_from_texts,
+    estimate_tokens, generate_extraction_prompt, create_simple_schema, _get_client, _get_async_client, _save_result, T
+)
+from .utils import (
+    timing, find_pending, walk_classified, read_text, write_atomic,
+    json_loads, _compile_path_filter
+)
 
 # Configure logging
 logging.basicConfig(
@@ -17,8 +33,116 @@ logging.basicConfig(
     datefmt='%H:%M:%S'
 )
 
+__all__ = [
+    "convert_dir", "extract_dir", "extract_dir_batched", "extract_dir_async",
+    "process_dir_streaming", "load_dir", "status_dir", "clean_dir"
+]
+
 logger = logging.getLogger(__name__)
 
+# Source extensions used when file_types is None, dotted and lowercase like find_files expects
+_DEFAULT_SOURCE_EXTS = _EXTENSIONS_NOT_SUPPORTED_BY_PANDOC
+
+
+def _source_extensions(file_types: Optional[List[str]]) -> frozenset:
+    """Normalize file_types (with or without dots) to a frozenset of dotted extensions."""
+    if file_types is None:
+        return _DEFAULT_SOURCE_EXTS
+    return frozenset(f".{ext.lstrip('.')}" for ext in file_types)
+
+
+def _discover(
+    directory: Union[str, Path],
+    extensions: Set[str],
+    output_suffix: str,
+    skip_existing: bool,
+    path_filter: str = None,
+    log_every: int = 1
+) -> Tuple[List[str], Dict[str, str]]:
+    """Find files to process, returning (pending, results) with up-to-date files already marked "skipped".
+
+    Paths are kept as the walk's strings and double as result keys.
+    """
+    pending, skipped = find_pending(directory, extensions, output_suffix if skip_existing else None, path_filter)
+    for i, path in enumerate(skipped):
+        if i % log_every == 0:
+            logger.info("Skipping up-to-date file: %s", path)
+    return pending, dict.fromkeys(skipped, "skipped")
+
+
+def _largest_first(paths: List[Union[str, Path]]) -> List[Union[str, Path]]:
+    """Order work longest-first (by file size) so short jobs fill the tail of a parallel run."""
+    return sorted(paths, key=lambda p: os.stat(p).st_size, reverse=True)
+
+
+def _sibling(path: str, suffix: str) -> str:
+    """Return path with its extension replaced by suffix, like Path.with_suffix on strings."""
+    return os.path.splitext(path)[0] + suffix
+
+
+def _summarize(results: Dict[str, str]) -> Counter:
+    """Count result statuses in one pass, folding every error message into "error"."""
+    counts = Counter("error" if status.startswith("error") else status for status in results.values())
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Summary: %s", ", ".join(f"{status}={count}" for status, count in sorted(counts.items())))
+    return counts
+
+
+def _log_progress(done: int, total: int, log_every: int):
+    """Log a progress line every ``log_every`` completed files (only when per-file logs are thinned)."""
+    if log_every > 1 and (done % log_every == 0 or done == total):
+        logger.info("Progress: %d/%d files", done, total)
+
+
+def _with_client(extractor_kwargs: dict, async_client: bool = False) -> dict:
+    """Return extractor kwargs carrying one Instructor client shared by every file in a run."""
+    if "client" in extractor_kwargs:
+        return extractor_kwargs
+    get_client = _get_async_client if async_client else _get_client
+    client = _LazyClient(partial(
+        get_client,
+        extractor_kwargs.get("provider", "ollama/llama3.2"),
+        extractor_kwargs.get("api_key"),
+        extractor_kwargs.get("mode")
+    ))
+    return {**extractor_kwargs, "client": client}
+
+
+class _LazyClient:
+    """Instructor client built on first use.
+
+    Runs served entirely from cache never construct a client, and construction
+    errors (e.g. a missing API key) are raised inside each file's extraction,
+    where they are recorded as that file's error status.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._client = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._factory()
+        return getattr(self._client, name)
+
+
+def _convert_one(file_path: str, verbose: bool = True, **converter_kwargs) -> Tuple[str, str]:
+    """Convert a single file and write its markdown sibling. Runs inside pool workers."""
+    if verbose:
+        logger.info("Processing file: %s", file_path)
+    try:
+        markdown_content = convert_to_markdown(file_path, **converter_kwargs)
+        write_atomic(_sibling(file_path, '.md'), markdown_content.encode('utf-8'))
+        if verbose:
+            logger.info("Successfully converted file: %s", file_path)
+        return file_path, "converted"
+    except Exception as e:
+        logger.error("Error converting file %s: %s", file_path, e)
+        return file_path, f"error: {str(e)}"
+
 
 @timing
 def convert_dir(
@@ -26,34 +150,60 @@ def convert_dir(
     file_types: Optional[List[str]] = None,
     skip_existing: bool = True,
     path_filter: str = None,
+    max_workers: Optional[int] = None,
+    executor: Literal["thread", "process"] = "process",
+    log_every: int = 1,
     **converter_kwargs
 ) -> Dict[str, str]:
-    """Convert all documents in directory to markdown."""
-    if file_types is None:
-        file_types = [ext.lstrip('.') for ext in _EXTENSIONS_NOT_SUPPORTED_BY_PANDOC]
-    
-    extensions = {f".{ext}" for ext in file_types}
-    files = find_files(directory, extensions, recursive=True, path_filter=path_filter)
-    results = {}
-    
-    for file_path in files:
-        logger.info(f"Processing file: {file_path}")
-        markdown_path = file_path.with_suffix('.md')
-        
-        if skip_existing and markdown_path.exists():
-            logger.info(f"Skipping existing file: {file_path}")
-            results[str(file_path)] = "skipped"
-            continue
-        
-        try:
-            markdown_content = convert_to_markdown(file_path, **converter_kwargs)
-            markdown_path.write_text(markdown_content, encoding='utf-8')
-            logger.info(f"Successfully converted file: {file_path}")
-            results[str(file_path)] = "converted"
-        except Exception as e:
-            logger.error(f"Error converting file {file_path}: {str(e)}")
-            results[str(file_path)] = f"error: {str(e)}"
-    
+    """Convert all documents in directory to markdown.
+
+    Files are converted concurrently. Pandoc-eligible files always go through a
+    thread pool (one thread per CPU), since each conversion waits on a Pandoc
+    subprocess. Marker/Docling files go through ``executor``: "process"
+    (default) avoids GIL contention during model inference, "thread" shares
+    one set of loaded models. Worker processes are spawned, so scripts must
+    guard their entry point with ``if __name__ == "__main__":``.
+
+    Args:
+        max_workers: Number of Marker/Docling pool workers (default: min(cpu_count, 5))
+        executor: Pool type for Marker/Docling files, "process" or "thread"
+        log_every: Log only every Nth file (plus a progress line) on large batches
+    """
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, 5)
+
+    extensions = _source_extensions(file_types)
+    pending, results = _discover(directory, extensions, ".md", skip_existing, path_filter, log_every)
+    pending = _largest_first(pending)
+
+    # Pandoc handles text formats unless another backend is forced
+    if converter_kwargs.get("use_marker") or converter_kwargs.get("use_docling"):
+        pandoc_files, model_files = [], pending
+    else:
+        pandoc_files, model_files = [], []
+        for f in pending:
+            is_model_file = os.path.splitext(f)[1].lower() in _EXTENSIONS_NOT_SUPPORTED_BY_PANDOC
+            (model_files if is_model_file else pandoc_files).append(f)
+
+    futures = {}
+    pool_class = _process_pool if executor == "process" else ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pandoc_pool, \
+            pool_class(max_workers=max_workers) as model_pool:
+        for pool, files in ((pandoc_pool, pandoc_files), (model_pool, model_files)):
+            for i, f in enumerate(files):
+                futures[pool.submit(_convert_one, f, i % log_every == 0, **converter_kwargs)] = f
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                path, status = future.result()
+            except Exception as e:
+                # Pool-level failures (unpicklable arguments, a crashed worker) surface here
+                path = futures[future]
+                logger.error("Error converting file %s: %s", path, e)
+                status = f"error: {str(e)}"
+            results[path] = status
+            _log_progress(done, len(futures), log_every)
+
+    _summarize(results)
     return results
 
 
@@ -63,32 +213,551 @@ def extract_dir(
     response_model: Type[T],
     skip_existing: bool = True,
     path_filter: str = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    max_workers: int = 16,
+    prefetch: bool = True,
+    log_every: int = 1,
+    batch_size: int = 1,
+    max_input_tokens: int = 100_000,
+    **extractor_kwargs
+) -> Dict[str, str]:
+    """Extract structured data from all markdown files in directory.
+
+    Files are extracted on a thread pool; LLM calls are network-bound, so
+    threads overlap their latency.
+
+    Args:
+        cache_dir: Directory for cached LLM results; re-runs with unchanged
+                   provider, prompt and markdown skip the LLM call
+        max_workers: Number of concurrent extractions
+        prefetch: Read markdown ahead on a background thread so workers
+                  start their LLM call without waiting on disk
+        log_every: Log only every Nth file (plus a progress line) on large batches
+        batch_size: Pack up to this many files into one LLM call (see
+                    extract_dir_batched); buckets are also capped at
+                    max_input_tokens and fall back to per-file calls on failure
+        max_input_tokens: Token budget per LLM call when batch_size > 1
+    """
+    pending, results = _discover(directory, {".md"}, ".json", skip_existing, path_filter, log_every)
+    pending = _largest_first(pending)
+    if pending:
+        extractor_kwargs = _with_client(extractor_kwargs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        if batch_size > 1:
+            results.update(_extract_batches(
+                pool, pending, response_model, batch_size, max_input_tokens,
+                cache_dir=cache_dir, **extractor_kwargs
+            ))
+            _summarize(results)
+            return results
+
+        if prefetch:
+            # Bounded so read-ahead stays just in front of the workers
+            texts = queue.Queue(maxsize=2 * max_workers)
+            threading.Thread(target=_read_ahead, args=(pending, texts), daemon=True).start()
+            futures = [
+                pool.submit(
+                    _extract_next, texts, response_model,
+                    verbose=i % log_every == 0, cache_dir=cache_dir, **extractor_kwargs
+                )
+                for i in range(len(pending))
+            ]
+        else:
+            futures = [
+                pool.submit(
+                    _extract_one, markdown_path, response_model,
+                    verbose=i % log_every == 0, cache_dir=cache_dir, **extractor_kwargs
+                )
+                for i, markdown_path in enumerate(pending)
+            ]
+        for done, future in enumerate(as_completed(futures), 1):
+            path, status = future.result()
+            results[path] = status
+            _log_progress(done, len(futures), log_every)
+
+    _summarize(results)
+    return results
+
+
+def _extract_batches(
+    pool: ThreadPoolExecutor,
+    pending: List[str],
+    response_model: Type[T],
+    batch_size: int,
+    max_input_tokens: int,
+    provider: str = "ollama/llama3.2",
+    api_key: Optional[str] = None,
     **extractor_kwargs
 ) -> Dict[str, str]:
-    """Extract structured data from all markdown files in directory."""
-    markdown_files = find_files(directory, {".md"}, recursive=True, path_filter=path_filter)
+    """Read pending files, pack them into buckets and extract the buckets on the pool.
+
+    Each bucket is submitted as soon as it is packed, so reading overlaps the
+    LLM calls already in flight; unreadable files get an error status.
+    """
     results = {}
+    save_json = extractor_kwargs.pop('save_json', True)
+    prompt_tokens = estimate_tokens(
+        generate_extraction_prompt(response_model, extractor_kwargs.get("use_evidence", True)),
+        provider
+    )
+    documents = _read_documents(pending, results)
+    buckets = _pack_buckets(documents, max_input_tokens - prompt_tokens, provider, batch_size)
 
-    for markdown_path in markdown_files:
-        logger.info(f"Processing file: {markdown_path}")
-        json_path = markdown_path.with_suffix('.json')
+    futures = [
+        pool.submit(_extract_bucket, bucket, response_model, provider, api_key, save_json, **extractor_kwargs)
+        for bucket in buckets
+    ]
+    for future in as_completed(futures):
+        results.update(future.result())
+    return results
 
-        if skip_existing and json_path.exists():
-            logger.info(f"Skipping existing file: {markdown_path}")
-            results[str(markdown_path)] = "skipped"
-            continue
 
+def _read_ahead(paths: List[str], texts: queue.Queue):
+    """Read files in order into the queue; None marks a failed read.
+
+    Every path is queued exactly once whatever the read raises (e.g.
+    UnicodeDecodeError), since each worker blocks until it gets an item.
+    """
+    for path in paths:
         try:
+            text = read_text(path)
+        except Exception:
+            # Leave it to the worker to re-read and report the error
+            text = None
+        texts.put((path, text))
+
+
+def _extract_next(texts: queue.Queue, response_model: Type[T], **extractor_kwargs) -> Tuple[str, str]:
+    """Extract the next prefetched file from the queue."""
+    markdown_path, text = texts.get()
+    return _extract_one(markdown_path, response_model, text=text, **extractor_kwargs)
+
+
+def _extract_one(
+    markdown_path: str,
+    response_model: Type[T],
+    text: Optional[str] = None,
+    verbose: bool = True,
+    **extractor_kwargs
+) -> Tuple[str, str]:
+    """Extract from a single markdown file and write its JSON sibling."""
+    if verbose:
+        logger.info("Processing file: %s", markdown_path)
+    try:
+        if text is None:
             extract_from_file(markdown_path, response_model, **extractor_kwargs)
-            logger.info(f"Successfully extracted from file: {markdown_path}")
-            results[str(markdown_path)] = "extracted"
+        else:
+            save_json = extractor_kwargs.pop('save_json', True)
+            result = extract_from_text(text, response_model, **extractor_kwargs)
+            if save_json:
+                _save_result(result, _sibling(markdown_path, '.json'))
+        if verbose:
+            logger.info("Successfully extracted from file: %s", markdown_path)
+        return markdown_path, "extracted"
+    except Exception as e:
+        logger.error("Error extracting from file %s: %s", markdown_path, e)
+        return markdown_path, f"error: {str(e)}"
+
+
+@timing
+def extract_dir_batched(
+    directory: Union[str, Path],
+    response_model: Type[T],
+    max_input_tokens: int = 100_000,
+    skip_existing: bool = True,
+    path_filter: str = None,
+    provider: str = "ollama/llama3.2",
+    api_key: Optional[str] = None,
+    **extractor_kwargs
+) -> Dict[str, str]:
+    """Extract structured data from markdown files, packing several files per LLM call.
+
+    Files are greedily packed into buckets whose estimated size stays within
+    max_input_tokens (including the prompt), so the schema prompt and request
+    overhead are paid once per bucket instead of once per file. Files larger
+    than the budget, and buckets whose batched call fails, are extracted one
+    file at a time.
+
+    Args:
+        max_input_tokens: Token budget per LLM call
+    """
+    pending, results = _discover(directory, {".md"}, ".json", skip_existing, path_filter)
+
+    prompt_tokens = estimate_tokens(
+        generate_extraction_prompt(response_model, extractor_kwargs.get("use_evidence", True)),
+        provider
+    )
+    documents = _read_documents(pending, results)
+
+    for bucket in _pack_buckets(documents, max_input_tokens - prompt_tokens, provider):
+        results.update(_extract_bucket(bucket, response_model, provider, api_key, **extractor_kwargs))
+
+    _summarize(results)
+    return results
+
+
+def _read_documents(paths: Iterable[str], results: Dict[str, str]) -> Iterator[Tuple[str, str]]:
+    """Lazily read (path, text) pairs; unreadable files are recorded in results and skipped."""
+    for markdown_path in paths:
+        try:
+            yield markdown_path, read_text(markdown_path)
         except Exception as e:
-            logger.error(f"Error extracting from file {markdown_path}: {str(e)}")
-            results[str(markdown_path)] = f"error: {str(e)}"
+            logger.error("Error reading file %s: %s", markdown_path, e)
+            results[markdown_path] = f"error: {str(e)}"
 
+
+def _pack_buckets(
+    documents: Iterable[Tuple[str, str]],
+    budget: int,
+    provider: str,
+    max_files: Optional[int] = None
+) -> Iterator[List[Tuple[str, str]]]:
+    """Greedily pack (path, text) pairs into buckets within a token budget and file count.
+
+    Buckets are yielded as soon as they are full, so only one bucket of text
+    is held at a time. Documents larger than the budget get a bucket of their own.
+    """
+    current, current_tokens = [], 0
+
+    for markdown_path, text in documents:
+        tokens = estimate_tokens(text, provider)
+
+        if tokens > budget:
+            yield [(markdown_path, text)]
+            continue
+
+        if current and (current_tokens + tokens > budget or len(current) == max_files):
+            yield current
+            current, current_tokens = [], 0
+        current.append((markdown_path, text))
+        current_tokens += tokens
+
+    if current:
+        yield current
+
+
+def _extract_bucket(
+    bucket: List[Tuple[str, str]],
+    response_model: Type[T],
+    provider: str,
+    api_key: Optional[str],
+    save_json: bool = True,
+    **extractor_kwargs
+) -> Dict[str, str]:
+    """Extract a bucket of (path, text) in one call, falling back to per-file calls.
+
+    JSON siblings are written only when save_json is True, as in extract_from_file.
+    """
+    if len(bucket) > 1:
+        logger.info("Extracting batch of %d files", len(bucket))
+        try:
+            items = extract_batch_from_texts(
+                [(os.path.basename(markdown_path), text) for markdown_path, text in bucket],
+                response_model, provider, api_key, **extractor_kwargs
+            )
+            if save_json:
+                for (markdown_path, _), item in zip(bucket, items):
+                    _save_result(item, _sibling(markdown_path, '.json'))
+            logger.info("Successfully extracted batch of %d files", len(bucket))
+            return {markdown_path: "extracted" for markdown_path, _ in bucket}
+        except Exception as e:
+            logger.warning("Batch extraction failed, extracting files individually: %s", e)
+
+    results = {}
+    for markdown_path, text in bucket:
+        logger.info("Processing file: %s", markdown_path)
+        try:
+            result = extract_from_text(text, response_model, provider, api_key, **extractor_kwargs)
+            if save_json:
+                _save_result(result, _sibling(markdown_path, '.json'))
+            logger.info("Successfully extracted from file: %s", markdown_path)
+            results[markdown_path] = "extracted"
+        except Exception as e:
+            logger.error("Error extracting from file %s: %s", markdown_path, e)
+            results[markdown_path] = f"error: {str(e)}"
     return results
 
 
+@timing
+def extract_dir_async(
+    directory: Union[str, Path],
+    response_model: Type[T],
+    concurrency: int = 16,
+    skip_existing: bool = True,
+    path_filter: str = None,
+    **extractor_kwargs
+) -> Dict[str, str]:
+    """Extract structured data from all markdown files with concurrent async LLM calls.
+
+    Requests are network-bound, so up to ``concurrency`` of them are kept in
+    flight at once using Instructor's async client.
+
+    Args:
+        concurrency: Maximum number of simultaneous LLM requests
+    """
+    return asyncio.run(_extract_dir_async(
+        directory, response_model, concurrency, skip_existing, path_filter, **extractor_kwargs
+    ))
+
+
+async def _extract_dir_async(
+    directory: Union[str, Path],
+    response_model: Type[T],
+    concurrency: int,
+    skip_existing: bool,
+    path_filter: str,
+    **extractor_kwargs
+) -> Dict[str, str]:
+    semaphore = asyncio.Semaphore(concurrency)
+    pending, results = _discover(directory, {".md"}, ".json", skip_existing, path_filter)
+    pending = _largest_first(pending)
+    if pending:
+        extractor_kwargs = _with_client(extractor_kwargs, async_client=True)
+
+    async def worker(markdown_path: str) -> None:
+        async with semaphore:
+            logger.info("Processing file: %s", markdown_path)
+            text = await asyncio.to_thread(read_text, markdown_path)
+            result = await extract_from_text_async(text, response_model, **extractor_kwargs)
+            await asyncio.to_thread(_save_result, result, _sibling(markdown_path, '.json'))
+            logger.info("Successfully extracted from file: %s", markdown_path)
+
+    outcomes = await asyncio.gather(*[worker(p) for p in pending], return_exceptions=True)
+
+    for markdown_path, outcome in zip(pending, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("Error extracting from file %s: %s", markdown_path, outcome)
+            results[markdown_path] = f"error: {str(outcome)}"
+        else:
+            results[markdown_path] = "extracted"
+
+    _summarize(results)
+    return results
+
+
+@timing
+def process_dir_streaming(
+    directory: Union[str, Path],
+    response_model: Type[T],
+    workers: Optional[int] = None,
+    file_types: Optional[List[str]] = None,
+    skip_existing: bool = True,
+    path_filter: str = None,
+    converter_kwargs: Optional[dict] = None,
+    convert_workers: Optional[int] = None,
+    extract_workers: Optional[int] = None,
+    **extractor_kwargs
+) -> Dict[str, str]:
+    """Convert and extract all documents in directory in a single streaming pass.
+
+    Each document is converted in a process pool and its markdown handed
+    straight to an async extraction worker, so the directory is scanned once,
+    markdown is never re-read from disk, and LLM calls overlap with the next
+    conversions. Both .md and .json sidecars are written atomically. Conversion
+    processes are spawned, so scripts must guard their entry point with
+    ``if __name__ == "__main__":``.
+
+    Args:
+        workers: Default for both stages (default: min(cpu_count, 5))
+        converter_kwargs: Keyword arguments for convert_to_markdown
+        convert_workers: Conversion processes; conversion is CPU-bound (default: workers)
+        extract_workers: Concurrent extractions; LLM calls are network-bound (default: workers)
+    """
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 5)
+
+    return asyncio.run(_process_dir_streaming(
+        directory, response_model, convert_workers or workers, extract_workers or workers,
+        file_types, skip_existing, path_filter, converter_kwargs or {}, **extractor_kwargs
+    ))
+
+
+async def _process_dir_streaming(
+    directory: Union[str, Path],
+    response_model: Type[T],
+    convert_workers: int,
+    extract_workers: int,
+    file_types: Optional[List[str]],
+    skip_existing: bool,
+    path_filter: str,
+    converter_kwargs: dict,
+    **extractor_kwargs
+) -> Dict[str, str]:
+    extensions = _source_extensions(file_types)
+    pending, results = _discover(directory, extensions, ".json", skip_existing, path_filter)
+    # Sources whose markdown is already up to date only need extraction
+    converted = set(find_pending(directory, extensions, ".md", path_filter)[1]) if skip_existing else set()
+
+    pending = _largest_first(pending)
+    if pending:
+        extractor_kwargs = _with_client(extractor_kwargs, async_client=True)
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=2 * extract_workers)
+    converting = asyncio.Semaphore(convert_workers)
+
+    async def convert(pool: ProcessPoolExecutor, file_path: str) -> None:
+        markdown_path = _sibling(file_path, '.md')
+        async with converting:
+            logger.info("Processing file: %s", file_path)
+            try:
+                if file_path in converted:
+                    markdown = await asyncio.to_thread(read_text, markdown_path)
+                else:
+                    markdown = await loop.run_in_executor(
+                        pool, partial(convert_to_markdown, file_path, **converter_kwargs)
+                    )
+                    await asyncio.to_thread(write_atomic, markdown_path, markdown.encode('utf-8'))
+            except Exception as e:
+                logger.error("Error converting file %s: %s", file_path, e)
+                results[file_path] = f"error: {str(e)}"
+                return
+            await queue.put((file_path, markdown))
+
+    async def produce() -> None:
+        with _process_pool(convert_workers) as pool:
+            await asyncio.gather(*[convert(pool, file_path) for file_path in pending])
+        for _ in range(extract_workers):
+            await queue.put(None)
+
+    async def consume() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            file_path, markdown = item
+            try:
+                result = await extract_from_text_async(markdown, response_model, **extractor_kwargs)
+                await asyncio.to_thread(_save_result, result, _sibling(file_path, '.json'))
+                logger.info("Successfully processed file: %s", file_path)
+                results[file_path] = "extracted"
+            except Exception as e:
+                logger.error("Error extracting from file %s: %s", file_path, e)
+                results[file_path] = f"error: {str(e)}"
+
+    await asyncio.gather(produce(), *[consume() for _ in range(extract_workers)])
+
+    _summarize(results)
+    return results
+
+
+@timing
+def load_dir(
+    directory: Union[str, Path],
+    response_model: Type[T],
+    path_filter: str = None,
+    trusted: bool = False
+) -> Dict[str, BaseModel]:
+    """Load extracted JSON results (the .json siblings of .md files) back into models.
+
+    The raw file bytes are joined into one JSON array and parsed and validated
+    by pydantic-core in a single TypeAdapter(List[response_model]).validate_json
+    call, without building intermediate dicts. If that fails, or a malformed
+    file contributes more than one element, files are validated one at a time,
+    accepting results saved from the simplified fallback schema; files that
+    match neither are logged and left out.
+
+    Args:
+        directory: Directory to scan recursively
+        response_model: Pydantic model the results were extracted with
+        path_filter: Only load JSON files whose path matches this filter
+        trusted: Skip validation and build models with model_construct. Only for
+                 files this package wrote itself from already-validated results;
+                 values keep their JSON form (e.g. dates stay ISO strings)
+
+    Returns:
+        Dictionary mapping JSON path to the loaded model
+    """
+    matches = _compile_path_filter(path_filter)
+    markdown_roots, json_paths = set(), []
+    for path, kind in walk_classified(directory, ()):
+        if kind == "md":
+            markdown_roots.add(os.path.splitext(path)[0])
+        elif matches is None or matches(path):
+            json_paths.append(path)
+
+    loaded_paths, raw = [], []
+    for path in json_paths:
+        if os.path.splitext(path)[0] not in markdown_roots:
+            continue
+        try:
+            with open(path, 'rb') as f:
+                raw.append(f.read())
+            loaded_paths.append(path)
+        except OSError as e:
+            logger.error("Error loading file %s: %s", path, e)
+    json_paths = loaded_paths
+
+    if trusted:
+        return {path: _construct_trusted(response_model, json_loads(data)) for path, data in zip(json_paths, raw)}
+
+    try:
+        items = _list_adapter(response_model).validate_json(b"[" + b",".join(raw) + b"]")
+        # A file such as '{...},{...}' adds extra elements and would shift every later result
+        if len(items) == len(json_paths):
+            return dict(zip(json_paths, items))
+        logger.warning("Some results are not single JSON objects, validating files individually")
+    except ValidationError:
+        logger.warning("Some results do not match %s, validating files individually", response_model.__name__)
+
+    results = {}
+    simple_schema = create_simple_schema(response_model)
+    for path, data in zip(json_paths, raw):
+        for model in (response_model, simple_schema):
+            try:
+                results[path] = model.model_validate_json(data)
+                break
+            except ValidationError as e:
+                error = e
+        else:
+            logger.error("Error loading file %s: %s", path, error)
+    return results
+
+
+def _construct_trusted(model: Type[BaseModel], data: dict) -> BaseModel:
+    """Build model from trusted data with model_construct, recursing into nested models."""
+    values = {
+        name: _construct_value(field.annotation, data[name])
+        for name, field in model.model_fields.items() if name in data
+    }
+    return model.model_construct(**values)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Build nested models in value following annotation, e.g. Optional[IntWithEvidence] or List[Model]."""
+    origin = get_origin(annotation)
+    if origin is None:
+        if isinstance(value, dict) and isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return _construct_trusted(annotation, value)
+        return value
+
+    args = get_args(annotation)
+    if origin in (list, set, frozenset, tuple):
+        if not isinstance(value, list) or not args:
+            return value
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            return [_construct_value(arg, item) for arg, item in zip(args, value)] + value[len(args):]
+        return [_construct_value(args[0], item) for item in value]
+    if origin is dict:
+        if not isinstance(value, dict) or len(args) != 2:
+            return value
+        return {key: _construct_value(args[1], item) for key, item in value.items()}
+
+    # Optional/Union (and Annotated): use the first member that builds a model from value
+    for arg in args:
+        constructed = _construct_value(arg, value)
+        if constructed is not value:
+            return constructed
+    return value
+
+
+@lru_cache(maxsize=16)
+def _list_adapter(response_model: Type[T]) -> TypeAdapter:
+    """Return a cached adapter validating a list of response_model in one call."""
+    return TypeAdapter(List[response_model])
+
+
 @timing
 def status_dir(
     directory: Union[str, Path],
@@ -105,32 +774,33 @@ def status_dir(
     Returns:
         Dictionary with conversion and extraction statistics
     """
-    if file_types is None:
-        file_types = [ext.lstrip('.') for ext in _EXTENSIONS_NOT_SUPPORTED_BY_PANDOC]
-    
-    extensions = {f".{ext}" for ext in file_types}
-    total_files = find_files(directory, extensions, recursive=True, path_filter=path_filter)
-    markdown_files = find_files(directory, {".md"}, recursive=True, path_filter=path_filter)
-    
-    converted_count = 0
-    for file_path in total_files:
-        markdown_path = file_path.with_suffix('.md')
-        if markdown_path.exists():
-            converted_count += 1
-    
-    extracted_count = 0
-    for markdown_path in markdown_files:
-        json_path = markdown_path.with_suffix('.json')
-        if json_path.exists():
-            extracted_count += 1
+    extensions = _source_extensions(file_types)
+    matches = _compile_path_filter(path_filter)
+
+    # One walk classifies sources, markdown and JSON; siblings are matched by
+    # their extension-less path string, so no Path objects or stats are needed
+    source_roots, markdown_roots = [], []
+    markdown_keys, json_keys = set(), set()
+    for path, kind in walk_classified(directory, extensions):
+        root = os.path.splitext(path)[0]
+        if kind == "json":
+            json_keys.add(root)
+            continue
+        if kind == "md":
+            markdown_keys.add(root)
+        if matches is None or matches(path):
+            (markdown_roots if kind == "md" else source_roots).append(root)
+
+    converted_count = sum(root in markdown_keys for root in source_roots)
+    extracted_count = sum(root in json_keys for root in markdown_roots)
     
     stats = {
-        'total_source_files': len(total_files),
+        'total_source_files': len(source_roots),
         'converted_to_md': converted_count,
-        'total_md_files': len(markdown_files),
+        'total_md_files': len(markdown_roots),
         'extracted_to_json': extracted_count,
-        '% converted': round(converted_count/len(total_files)*100, 1) if total_files else 0,
-        '% extracted': round(extracted_count/len(markdown_files)*100, 1) if markdown_files else 0
+        '% converted': round(converted_count/len(source_roots)*100, 1) if source_roots else 0,
+        '% extracted': round(extracted_count/len(markdown_roots)*100, 1) if markdown_roots else 0
     }
     
     print(f"Directory status for {directory}:")
@@ -144,7 +814,9 @@ def status_dir(
 def clean_dir(
     directory: Union[str, Path],
     file_types: Optional[List[str]] = None,
-    path_filter: str = None
+    path_filter: str = None,
+    max_workers: int = 4,
+    log_every: int = 1
 ) -> Dict[str, str]:
     """Delete files with specified extensions.
 
@@ -152,24 +824,26 @@ def clean_dir(
         directory: Directory to clean
         file_types: List of file extensions to delete (without dots)
                    If None, uses default conversion extensions
+        max_workers: Number of threads issuing deletions
+        log_every: Log only every Nth deleted file
 
     Returns:
         Dictionary with deletion results for each file
     """
-    if file_types is None:
-        file_types = [ext.lstrip('.') for ext in _EXTENSIONS_NOT_SUPPORTED_BY_PANDOC]
-
-    extensions = {f".{ext}" for ext in file_types}
-    target_files = find_files(directory, extensions, recursive=True, path_filter=path_filter)
-    results = {}
+    extensions = _source_extensions(file_types)
+    target_files, _ = find_pending(directory, extensions, None, path_filter)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        verbose = (i % log_every == 0 for i in range(len(target_files)))
+        return dict(pool.map(_delete_one, target_files, verbose))
 
-    for target_file in target_files:
-        try:
-            target_file.unlink()
-            logger.info(f"Deleted file: {target_file}")
-            results[str(target_file)] = "deleted"
-        except Exception as e:
-            logger.error(f"Error deleting file {target_file}: {str(e)}")
-            results[str(target_file)] = f"error: {str(e)}"
 
-    return results
+def _delete_one(target_file: str, verbose: bool = True) -> Tuple[str, str]:
+    """Delete a single file."""
+    try:
+        os.unlink(target_file)
+        if verbose:
+            logger.info("Deleted file: %s", target_file)
+        return target_file, "deleted"
+    except Exception as e:
+        logger.error("Error deleting file %s: %s", target_file, e)
+        return target_file, f"error: {str(e)}"
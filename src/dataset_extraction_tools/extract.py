@@ -3,94 +3,143 @@ Simplified structured data extraction using Instructor with evidence tracking.
 Combines evidence models and extraction logic in a single focused module.
 """
 
-import json
+import asyncio
+import hashlib
+import io
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Union, Optional, TypeVar, Type, List, Any
+from typing import Union, Optional, TypeVar, Type, List, Tuple, Any, Generic, Literal, Annotated
 from datetime import date
-from pydantic import BaseModel, Field, create_model
-from .utils import timing
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, Strict, ValidationError, create_model
+from .cache import cache_key, read_entry, write_entry, evict_entry
+from .utils import timing, read_text, json_dumps, json_loads, write_atomic
+
+__all__ = [
+    "WithEvidence", "StringWithEvidence", "IntWithEvidence", "FloatWithEvidence",
+    "DateWithEvidence", "EnumWithEvidence",
+    "create_simple_schema", "create_batch_schema", "generate_extraction_prompt", "schema_from_json",
+    "extract_from_text", "extract_from_text_async", "extract_from_file", "extract_from_files",
+    "extract_batch_from_texts", "estimate_tokens", "PROMPT_VERSION"
+]
 
 logger = logging.getLogger(__name__)
 
 try:
     import instructor
-    from pydantic import BaseModel, Field
 except ImportError:
     raise ImportError("Install dependencies: pip install instructor pydantic")
 
+from tenacity import AsyncRetrying, Retrying, stop_after_attempt
+
+try:
+    from instructor.exceptions import InstructorRetryException
+    _VALIDATION_ERRORS = (ValidationError, InstructorRetryException)
+except ImportError:
+    _VALIDATION_ERRORS = (ValidationError,)
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 T = TypeVar('T', bound=BaseModel)
+# Values an evidence field can hold; the bound is also the value type of a bare WithEvidence
+EvidenceValue = Union[str, int, float, date]
+ValueT = TypeVar('ValueT', bound=EvidenceValue)
+
+# Bump when prompt construction changes so cached extractions are invalidated
+PROMPT_VERSION = "2"
+
+# Static prompt parts; kept byte-identical across calls so providers can
+# reuse cached prompt prefixes
+_PROMPT_REQUIREMENTS = """CRITICAL REQUIREMENTS:
+- Extract ONLY text that appears verbatim in the document
+- Do not infer, estimate, or add any information not explicitly stated"""
+
+_EVIDENCE_REQUIREMENTS = """
+- Provide exact quotes as evidence for each field
+- Include confidence score between 0.0 and 1.0
+- Use confidence 0.0 if information is not found"""
+
+_SIMPLE_REQUIREMENTS = """
+- Return null/empty for fields not found in the document"""
+
+_RETRY_FEEDBACK = "Your output had error: {error}. Fix and retry."
+_MAX_ATTEMPTS = 2
+
+_clients = {}
+_clients_lock = threading.Lock()
 
 
 # Evidence tracking models
-class WithEvidence(BaseModel):
+class WithEvidence(BaseModel, Generic[ValueT]):
     """Base model for extracted fields with evidence tracking"""
-    value: Any = Field(..., description="The extracted value")
-    evidence: str = Field(..., description="Exact quote from document supporting this value")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score between 0 and 1")
-    
-    class Config:
-        json_encoders = {date: lambda v: v.isoformat()}
-
+    # Validators are built on first use instead of at import; instances are
+    # immutable once extracted (both inherited by parametrizations)
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
-class StringWithEvidence(WithEvidence):
-    value: Optional[str] = None
+    value: Optional[ValueT] = Field(None, description="The extracted value")
+    evidence: str = Field(..., description="Exact quote from document supporting this value")
+    # Strict: the LLM returns a JSON number, so skip lax str/Decimal coercion (ints are still accepted)
+    confidence: float = Field(..., ge=0.0, le=1.0, strict=True, description="Confidence score between 0 and 1")
 
 
-class IntWithEvidence(WithEvidence):
-    value: Optional[int] = None
+# Pydantic caches parametrized generics, so each alias is built once and shared
+StringWithEvidence = WithEvidence[str]
+IntWithEvidence = WithEvidence[Annotated[int, Strict()]]
+FloatWithEvidence = WithEvidence[Annotated[float, Strict()]]
+DateWithEvidence = WithEvidence[date]
+EnumWithEvidence = WithEvidence[str]
 
 
-class FloatWithEvidence(WithEvidence):
-    value: Optional[float] = None
+def _simple_type(annotation: Any) -> Any:
+    """Return the plain Optional value type for an evidence type, or annotation unchanged."""
+    if not (isinstance(annotation, type) and issubclass(annotation, WithEvidence)):
+        return annotation
+    if annotation.__pydantic_generic_metadata__['parameters']:
+        # Bare WithEvidence validates against the TypeVar bound
+        return Optional[EvidenceValue]
+    # Resolved on parametrization, and respects subclasses that override value
+    return annotation.model_fields['value'].annotation
 
 
-class DateWithEvidence(WithEvidence):
-    value: Optional[date] = None
+@lru_cache(maxsize=None)
+def _field_layout(model: Type[BaseModel]) -> Tuple[Tuple[str, str, Any, bool], ...]:
+    """
+    Return (name, description, annotation, is_evidence) for each field of model.
+    Computed once per model class so schema and prompt builders skip the reflection.
+    """
+    layout = []
+    for field_name, field in model.model_fields.items():
+        field_desc = field.description or f"Field: {field_name}"
+        # FieldInfo.annotation also covers fields inherited from base models
+        annotation = field.annotation
+        is_evidence = isinstance(annotation, type) and issubclass(annotation, WithEvidence)
+        layout.append((field_name, field_desc, annotation, is_evidence))
 
+    return tuple(layout)
 
-class EnumWithEvidence(WithEvidence):
-    value: Optional[str] = None
 
+@lru_cache(maxsize=None)
 def create_simple_schema(response_model: Type[T]) -> Type[BaseModel]:
     """
     Create a simplified version of schema without evidence tracking.
     Converts WithEvidence fields to their simple counterparts.
+    Cached per model class, so repeated calls return the same class.
+    Models without evidence fields are returned unchanged.
     """
+    layout = _field_layout(response_model)
+    if not any(is_evidence for _, _, _, is_evidence in layout):
+        return response_model
+
     field_definitions = {}
 
-    # Use model_fields for Pydantic v2 compatibility
-    if hasattr(response_model, 'model_fields'):
-        fields = response_model.model_fields
-    elif hasattr(response_model, '__fields__'):
-        fields = response_model.__fields__
-    else:
-        fields = {}
-
-    for field_name, field_obj in fields.items():
-        # Extract description from field
-        if hasattr(field_obj, 'description') and field_obj.description:
-            field_desc = field_obj.description
-        elif hasattr(field_obj, 'field_info') and hasattr(field_obj.field_info, 'description'):
-            field_desc = field_obj.field_info.description
-        else:
-            field_desc = f"Field: {field_name}"
-
-        # Get the field type from annotations
-        field_info = response_model.__annotations__.get(field_name, str)
-
-        # Convert evidence types to simple types
-        if field_info == StringWithEvidence:
-            field_definitions[field_name] = (Optional[str], Field(description=field_desc))
-        elif field_info == IntWithEvidence:
-            field_definitions[field_name] = (Optional[int], Field(description=field_desc))
-        elif field_info == FloatWithEvidence:
-            field_definitions[field_name] = (Optional[float], Field(description=field_desc))
-        elif field_info == DateWithEvidence:
-            field_definitions[field_name] = (Optional[date], Field(description=field_desc))
-        else:
-            # Keep other types as-is
-            field_definitions[field_name] = (field_info, Field(description=field_desc))
+    for field_name, field_desc, field_info, _ in layout:
+        field_definitions[field_name] = (_simple_type(field_info), Field(description=field_desc))
 
     # Create simplified model
     SimpleModel = create_model(
@@ -101,44 +150,21 @@ def create_simple_schema(response_model: Type[T]) -> Type[BaseModel]:
     return SimpleModel
 
 
+@lru_cache(maxsize=None)
 def generate_extraction_prompt(schema: Type[BaseModel], use_evidence: bool = True) -> str:
-    """Generate extraction prompt from schema field descriptions."""
-    fields_desc = []
-
-    # Use model_fields for Pydantic v2 compatibility
-    if hasattr(schema, 'model_fields'):
-        fields = schema.model_fields
-    elif hasattr(schema, '__fields__'):
-        fields = schema.__fields__
-    else:
-        fields = {}
-
-    for field_name, field_obj in fields.items():
-        # Extract description from field
-        if hasattr(field_obj, 'description') and field_obj.description:
-            field_desc = field_obj.description
-        elif hasattr(field_obj, 'field_info') and hasattr(field_obj.field_info, 'description'):
-            field_desc = field_obj.field_info.description
-        else:
-            field_desc = f"Field: {field_name}"
-        fields_desc.append(f"- {field_name}: {field_desc}")
+    """Generate extraction prompt from schema field descriptions (cached per schema)."""
+    fields_desc = [f"- {field_name}: {field_desc}" for field_name, field_desc, _, _ in _field_layout(schema)]
 
     base_prompt = f"""Extract the following information from this document:
 
 {chr(10).join(fields_desc)}
 
-CRITICAL REQUIREMENTS:
-- Extract ONLY text that appears verbatim in the document
-- Do not infer, estimate, or add any information not explicitly stated"""
+{_PROMPT_REQUIREMENTS}"""
 
     if use_evidence:
-        base_prompt += """
-- Provide exact quotes as evidence for each field
-- Include confidence score between 0.0 and 1.0
-- Use confidence 0.0 if information is not found"""
+        base_prompt += _EVIDENCE_REQUIREMENTS
     else:
-        base_prompt += """
-- Return null/empty for fields not found in the document"""
+        base_prompt += _SIMPLE_REQUIREMENTS
 
     return base_prompt
 
@@ -157,25 +183,55 @@ def schema_from_json(json_path: str, schema_name = None) -> Type[BaseModel]:
     Example JSON format:
         {
           "project_id": "Applicant ID in format 'ORD2000111'. Location: top right",
-          "funding_requested": "Total funding amount requested. Location: budget section"
+          "funding_requested": "Total funding amount requested. Location: budget section",
+          "applicant_type": {
+            "description": "Who applies. Location: first page",
+            "enum": ["individual", "institution", "consortium"]
+          }
         }
+
+    Fields given as an object with an "enum" list only accept those values
+    (validated as a Literal); plain string fields accept any text.
     """
     json_file = Path(json_path)
-    
-    if not json_file.exists():
+
+    try:
+        mtime_ns = json_file.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Schema JSON file not found: {json_path}")
-    
-    with open(json_file, 'r', encoding='utf-8') as f:
-        fields_config = json.load(f)
+
+    return _schema_from_json_cached(str(json_file.resolve()), mtime_ns, schema_name)
+
+
+@lru_cache(maxsize=32)
+def _schema_from_json_cached(json_path: str, mtime_ns: int, schema_name) -> Type[BaseModel]:
+    """Build the model for schema_from_json; keyed on mtime so edits are picked up."""
+    json_file = Path(json_path)
+
+    fields_config = json_loads(json_file.read_bytes())
     
     if not isinstance(fields_config, dict):
         raise ValueError("JSON must be a dictionary with field_name: description format")
     
-    # Create field definitions - all StringWithEvidence, all required
+    # Create field definitions - StringWithEvidence or Literal choices, all required
     field_definitions = {}
-    for field_name, description in fields_config.items():
+    for field_name, spec in fields_config.items():
+        if isinstance(spec, dict):
+            description = spec.get("description", f"Field: {field_name}")
+            if "enum" in spec:
+                choices = spec["enum"]
+                valid = isinstance(choices, list) and choices and all(
+                    isinstance(choice, (str, int, float)) and not isinstance(choice, bool) for choice in choices
+                )
+                if not valid:
+                    raise ValueError(f"'enum' for field {field_name} must be a non-empty list of strings or numbers")
+                field_type = WithEvidence[Literal[tuple(choices)]]
+            else:
+                field_type = StringWithEvidence
+        else:
+            description, field_type = spec, StringWithEvidence
         field_definitions[field_name] = (
-            StringWithEvidence, 
+            field_type,
             Field(description=description)
         )
 
@@ -205,7 +261,9 @@ def extract_from_text(
     custom_prompt: Optional[str] = None,
     use_evidence: bool = True,
     auto_fallback: bool = True,
-    mode: Optional[str] = None
+    mode: Optional[str] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    client=None
 ) -> T:
     """
     Extract structured data from text with evidence tracking and auto-fallback.
@@ -214,41 +272,250 @@ def extract_from_text(
         use_evidence: Whether to use evidence tracking (WithEvidence fields)
         auto_fallback: If True, automatically retry with simplified schema on failure
         mode: Instructor mode (e.g., instructor.Mode.TOOLS for tool calling)
+        cache_dir: Directory for cached results keyed by provider, prompt and text
+        client: Instructor client to use instead of the cached one for provider
     """
-    client_kwargs = {} if api_key is None else {"api_key": api_key}
-    if mode is not None:
-        client_kwargs["mode"] = mode
-    client = instructor.from_provider(provider, **client_kwargs)
-
     # Generate schema-driven prompt if no custom prompt provided
     if custom_prompt is None:
         custom_prompt = generate_extraction_prompt(response_model, use_evidence)
 
-    prompt = f"{custom_prompt}\n\nDOCUMENT TEXT:\n{text}"
+    if cache_dir is not None:
+        key = cache_key(provider, PROMPT_VERSION, response_model.__name__, custom_prompt, text)
+        cached = _load_cached(cache_dir, key, response_model)
+        if cached is not None:
+            return cached
+
+    if client is None:
+        client = _get_client(provider, api_key, mode)
+    used_fallback = False
 
     try:
         # First attempt with original schema
-        return client.chat.completions.create(
-            response_model=response_model,
-            messages=[{"role": "user", "content": prompt}],
-            max_retries=2
-        )
+        result = _create_with_feedback(client, response_model, _build_messages(custom_prompt, text))
     except Exception as e:
         if auto_fallback and use_evidence:
             # Fallback: try with simplified schema (no evidence)
             logger.warning(f"Evidence extraction failed, falling back to simple extraction: {e}")
             simple_schema = create_simple_schema(response_model)
             simple_prompt = generate_extraction_prompt(simple_schema, use_evidence=False)
-            fallback_prompt = f"{simple_prompt}\n\nDOCUMENT TEXT:\n{text}"
 
-            return client.chat.completions.create(
-                response_model=simple_schema,
-                messages=[{"role": "user", "content": fallback_prompt}],
-                max_retries=2
-            )
+            result = _create_with_feedback(client, simple_schema, _build_messages(simple_prompt, text))
+            used_fallback = True
         else:
             raise e
 
+    if cache_dir is not None:
+        _store_cached(cache_dir, key, provider, response_model, used_fallback, result)
+
+    return result
+
+
+async def extract_from_text_async(
+    text: str,
+    response_model: Type[T],
+    provider: str = "ollama/llama3.2",
+    api_key: Optional[str] = None,
+    custom_prompt: Optional[str] = None,
+    use_evidence: bool = True,
+    auto_fallback: bool = True,
+    mode: Optional[str] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    client=None
+) -> T:
+    """Async variant of extract_from_text using Instructor's async client.
+
+    Pass ``client`` (from _get_async_client) to share one connection pool
+    across calls on the same event loop.
+    """
+    if custom_prompt is None:
+        custom_prompt = generate_extraction_prompt(response_model, use_evidence)
+
+    if cache_dir is not None:
+        key = cache_key(provider, PROMPT_VERSION, response_model.__name__, custom_prompt, text)
+        cached = _load_cached(cache_dir, key, response_model)
+        if cached is not None:
+            return cached
+
+    if client is None:
+        client = _get_async_client(provider, api_key, mode)
+    used_fallback = False
+
+    try:
+        result = await _acreate_with_feedback(client, response_model, _build_messages(custom_prompt, text))
+    except Exception as e:
+        if auto_fallback and use_evidence:
+            logger.warning(f"Evidence extraction failed, falling back to simple extraction: {e}")
+            simple_schema = create_simple_schema(response_model)
+            simple_prompt = generate_extraction_prompt(simple_schema, use_evidence=False)
+
+            result = await _acreate_with_feedback(client, simple_schema, _build_messages(simple_prompt, text))
+            used_fallback = True
+        else:
+            raise e
+
+    if cache_dir is not None:
+        _store_cached(cache_dir, key, provider, response_model, used_fallback, result)
+
+    return result
+
+
+def _client_kwargs(api_key: Optional[str], mode: Optional[str]) -> dict:
+    """Build keyword arguments for instructor.from_provider."""
+    client_kwargs = {} if api_key is None else {"api_key": api_key}
+    if mode is not None:
+        client_kwargs["mode"] = mode
+    return client_kwargs
+
+
+def _get_client(provider: str, api_key: Optional[str] = None, mode: Optional[str] = None):
+    """Return a cached sync Instructor client so HTTP connections are reused across calls.
+
+    The API key is only kept as a hash in the cache key.
+    """
+    key_hash = None if api_key is None else hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    client_key = (provider, key_hash, mode)
+
+    with _clients_lock:
+        client = _clients.get(client_key)
+        if client is None:
+            client = _clients[client_key] = instructor.from_provider(provider, **_client_kwargs(api_key, mode))
+    return client
+
+
+def _get_async_client(provider: str, api_key: Optional[str] = None, mode: Optional[str] = None):
+    """Create an async Instructor client; not cached since it is bound to the running event loop."""
+    return instructor.from_provider(provider, async_client=True, **_client_kwargs(api_key, mode))
+
+
+def _build_messages(prompt: str, text: str) -> List[dict]:
+    """Build chat messages: instructions as a stable system prefix, document last."""
+    return [
+        {"role": "system", "content": prompt},
+        {"role": "user", "content": f"DOCUMENT TEXT:\n{text}"}
+    ]
+
+
+def _create_with_feedback(client, response_model: Type[T], messages: List[dict]) -> T:
+    """Call the LLM, answering validation errors with a short feedback message and backoff.
+
+    On retry the failed output (when the error carries it) and the error are
+    appended instead of re-sending a fresh prompt, so the model corrects what
+    it wrote and each retry costs a small delta on top of the original request.
+    """
+    messages = list(messages)
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            # A one-attempt Retrying disables instructor's own full-prompt reask on
+            # every version (an int max_retries counts retries after the first call)
+            return client.chat.completions.create(
+                response_model=response_model,
+                messages=messages,
+                max_retries=Retrying(stop=stop_after_attempt(1), reraise=True)
+            )
+        except _VALIDATION_ERRORS as e:
+            if attempt == _MAX_ATTEMPTS - 1 or not _is_output_error(e):
+                raise
+            logger.warning(f"Validation failed (attempt {attempt + 1}), retrying with feedback: {e}")
+            messages.extend(_feedback_messages(e))
+            time.sleep(1.0 * (attempt + 1))
+
+
+def _is_output_error(error: Exception) -> bool:
+    """Return True if error is about the model's output rather than the API call.
+
+    Instructor wraps every failure, including auth and connection errors, in
+    InstructorRetryException; only parse and validation failures are worth feedback.
+    """
+    if isinstance(error, ValidationError):
+        return True
+    return bool(getattr(error, "failed_attempts", None)) or isinstance(error.__cause__, (ValidationError, ValueError))
+
+
+def _feedback_messages(error: Exception) -> List[dict]:
+    """Return the failed assistant output (when available) followed by the error feedback."""
+    feedback = {"role": "user", "content": _RETRY_FEEDBACK.format(error=error)}
+    output = _completion_text(getattr(error, "last_completion", None))
+    if output is None:
+        return [feedback]
+    return [{"role": "assistant", "content": output}, feedback]
+
+
+def _completion_text(completion: Any) -> Optional[str]:
+    """Extract the raw model output from an OpenAI- or Anthropic-style completion."""
+    if completion is None:
+        return None
+    try:
+        choices = getattr(completion, "choices", None)
+        if choices:
+            message = choices[0].message
+            if message.content:
+                return message.content
+            if message.tool_calls:
+                return message.tool_calls[0].function.arguments
+            return None
+        for block in getattr(completion, "content", None) or ():
+            if getattr(block, "text", None):
+                return block.text
+            if getattr(block, "input", None) is not None:
+                return json_dumps(block.input, indent=False).decode("utf-8")
+    except (AttributeError, IndexError, TypeError):
+        pass
+    return None
+
+
+async def _acreate_with_feedback(client, response_model: Type[T], messages: List[dict]) -> T:
+    """Async variant of _create_with_feedback."""
+    messages = list(messages)
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return await client.chat.completions.create(
+                response_model=response_model,
+                messages=messages,
+                max_retries=AsyncRetrying(stop=stop_after_attempt(1), reraise=True)
+            )
+        except _VALIDATION_ERRORS as e:
+            if attempt == _MAX_ATTEMPTS - 1 or not _is_output_error(e):
+                raise
+            logger.warning(f"Validation failed (attempt {attempt + 1}), retrying with feedback: {e}")
+            messages.extend(_feedback_messages(e))
+            await asyncio.sleep(1.0 * (attempt + 1))
+
+
+def _store_cached(
+    cache_dir: Union[str, Path],
+    key: str,
+    provider: str,
+    response_model: Type[T],
+    used_fallback: bool,
+    result: BaseModel
+) -> None:
+    """Write an extraction result to the cache together with its config."""
+    config = {
+        "provider": provider,
+        "prompt_version": PROMPT_VERSION,
+        "response_model": response_model.__name__,
+        "fallback": used_fallback
+    }
+    write_entry(cache_dir, key, config, result.model_dump(mode="json"))
+
+
+def _load_cached(cache_dir: Union[str, Path], key: str, response_model: Type[T]) -> Optional[T]:
+    """Revalidate a cached extraction; evict entries that no longer fit the schema."""
+    entry = read_entry(cache_dir, key)
+    if entry is None:
+        return None
+
+    try:
+        schema = create_simple_schema(response_model) if entry["config"]["fallback"] else response_model
+        result = schema.model_validate(entry["data"])
+    except (KeyError, TypeError, ValidationError) as e:
+        logger.warning(f"Evicting stale cache entry {key}: {e}")
+        evict_entry(cache_dir, key)
+        return None
+
+    logger.info(f"Using cached extraction {key}")
+    return result
+
 
 @timing
 def extract_from_file(
@@ -261,7 +528,7 @@ def extract_from_file(
 ) -> T:
     """Extract structured data from a single markdown file with evidence tracking and auto-fallback."""
     file_path = Path(file_path)
-    text = file_path.read_text(encoding='utf-8')
+    text = read_text(file_path)
 
     result = extract_from_text(text, response_model, provider, api_key, **kwargs)
 
@@ -284,22 +551,25 @@ def extract_from_files(
     if not file_paths:
         raise ValueError("No files provided")
     
-    # Combine all file contents
-    combined_content = []
+    # Stream file contents into one buffer instead of joining a list of copies
+    buffer = io.StringIO()
     valid_paths = []
     
     for i, file_path in enumerate(file_paths):
         file_path = Path(file_path)
         if file_path.exists():
-            text = file_path.read_text(encoding='utf-8')
-            combined_content.append(f"=== DOCUMENT {i+1}: {file_path.name} ===\n{text}")
+            if valid_paths:
+                buffer.write("\n\n")
+            buffer.write(f"=== DOCUMENT {i+1}: {file_path.name} ===\n")
+            buffer.write(read_text(file_path))
             valid_paths.append(file_path)
     
-    if not combined_content:
+    if not valid_paths:
         raise FileNotFoundError("No valid files found")
     
     # Single LLM call with combined content
-    full_content = "\n\n".join(combined_content)
+    full_content = buffer.getvalue()
+    buffer.close()
     result = extract_from_text(full_content, response_model, provider, api_key, **kwargs)
     
     # Save to first file's directory
@@ -310,46 +580,77 @@ def extract_from_files(
     return result
 
 
-def _serialize_value(value):
-    """Recursively serialize a value, handling BaseModel objects and WithEvidence types."""
-    # Handle None values
-    if value is None:
-        return None
+@lru_cache(maxsize=8)
+def _get_encoding(provider: str):
+    """Pick the tiktoken encoding for a provider's model, defaulting to o200k_base."""
+    try:
+        return tiktoken.encoding_for_model(provider.split('/', 1)[-1])
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
 
-    # Handle WithEvidence types
-    if hasattr(value, 'value') and hasattr(value, 'evidence') and hasattr(value, 'confidence'):
-        return {
-            'value': _serialize_value(value.value),
-            'evidence': value.evidence,
-            'confidence': value.confidence
-        }
 
-    # Handle BaseModel objects (like ORDProjectItem)
-    if isinstance(value, BaseModel):
-        serialized = {}
-        for field_name, field_value in value.__dict__.items():
-            if not field_name.startswith('_'):  # Skip private fields
-                serialized[field_name] = _serialize_value(field_value)
-        return serialized
+def estimate_tokens(text: str, provider: str = "") -> int:
+    """Estimate token count with tiktoken when available, else ~4 characters per token."""
+    if TIKTOKEN_AVAILABLE:
+        return len(_get_encoding(provider).encode(text, disallowed_special=()))
+    return len(text) // 4 + 1
+
+
+@lru_cache(maxsize=None)
+def create_batch_schema(response_model: Type[T]) -> Type[BaseModel]:
+    """Wrap a schema into a model holding one item per document."""
+    return create_model(
+        f"{response_model.__name__}_Batch",
+        items=(List[response_model], Field(description="One extracted item per document, in document order"))
+    )
+
+
+def extract_batch_from_texts(
+    documents: List[Tuple[str, str]],
+    response_model: Type[T],
+    provider: str = "ollama/llama3.2",
+    api_key: Optional[str] = None,
+    custom_prompt: Optional[str] = None,
+    use_evidence: bool = True,
+    **kwargs
+) -> List[T]:
+    """
+    Extract one result per document from several documents in a single LLM call.
+
+    Args:
+        documents: List of (name, text) tuples
+        custom_prompt: Per-document extraction prompt (defaults to schema-driven prompt)
 
-    # Handle lists
-    if isinstance(value, list):
-        return [_serialize_value(item) for item in value]
+    Returns:
+        List of results in the same order as documents
 
-    # Handle dictionaries
-    if isinstance(value, dict):
-        return {k: _serialize_value(v) for k, v in value.items()}
+    Raises:
+        ValueError: If the model returns a different number of items than documents
+    """
+    if custom_prompt is None:
+        custom_prompt = generate_extraction_prompt(response_model, use_evidence)
 
-    # Handle primitive types
-    return value
+    batch_prompt = f"""{custom_prompt}
+- The text contains {len(documents)} documents, each starting with a '=== DOCUMENT k: name ===' header
+- Return exactly one item per document, in the same order as the documents"""
 
+    combined_content = "\n\n".join(
+        f"=== DOCUMENT {i+1}: {name} ===\n{text}" for i, (name, text) in enumerate(documents)
+    )
 
-def _save_result(result: BaseModel, json_path: Path):
-    """Save extraction result to JSON with evidence tracking when available."""
-    data = {}
+    kwargs.pop("auto_fallback", None)
+    result = extract_from_text(
+        combined_content, create_batch_schema(response_model), provider, api_key,
+        custom_prompt=batch_prompt, use_evidence=use_evidence, auto_fallback=False, **kwargs
+    )
 
-    for field_name, field_value in result.__dict__.items():
-        if not field_name.startswith('_'):  # Skip private fields like _raw_response
-            data[field_name] = _serialize_value(field_value)
+    if len(result.items) != len(documents):
+        raise ValueError(f"Expected {len(documents)} items, got {len(result.items)}")
 
-    json_path.write_text(json.dumps(data, indent=2, ensure_ascii=False, default=str), encoding='utf-8')
\ No newline at end of file
+    return result.items
+
+
+def _save_result(result: BaseModel, json_path: Path):
+    """Save extraction result to JSON with evidence tracking when available."""
+    # pydantic-core serializes straight to indented UTF-8 bytes, without an intermediate dict
+    write_atomic(json_path, result.__pydantic_serializer__.to_json(result, indent=2))
@@ -1,11 +1,30 @@
+import json
 import logging
+import os
+import threading
+import uuid
 from functools import wraps
 from time import time
 from pathlib import Path
-from typing import Union, List, Set
+from typing import Union, List, Set, Tuple, Any, Iterator, Callable, Optional
+
+__all__ = [
+    "timing", "find_files", "find_pending", "index_files", "walk_classified",
+    "read_text", "write_atomic", "json_dumps", "json_loads"
+]
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Files up to this size are read into a reusable per-thread buffer
+_READ_BUFFER_SIZE = 1 << 20
+_read_buffers = threading.local()
+
 def timing(func):
     """Decorator to measure and log function execution time."""
 
@@ -22,17 +41,186 @@ def timing(func):
 
 def find_files(directory: Union[str, Path], extensions: Set[str], recursive: bool = True, path_filter: str = None) -> List[Path]:
     """File discovery in directory given a list of allowed extensions."""
+    paths = _walk_files(directory, extensions, recursive)
+
+    # Filter the raw entry paths so rejected files never become Path objects
+    matches = _compile_path_filter(path_filter)
+    if matches is None:
+        return [Path(path) for path in paths]
+    return [Path(path) for path in paths if matches(path)]
+
+
+def _compile_path_filter(path_filter: Optional[str]) -> Optional[Callable[[str], bool]]:
+    """Turn path_filter into a case-insensitive substring predicate on path strings, or None when there is no filter."""
+    if not path_filter:
+        return None
+    needle = path_filter.lower()
+    return lambda path: needle in path.lower()
+
+
+def find_pending(
+    directory: Union[str, Path],
+    extensions: Set[str],
+    output_suffix: Optional[str],
+    path_filter: str = None
+) -> Tuple[List[str], List[str]]:
+    """Split matching files into (pending, skipped) path strings in a single walk.
+
+    A file is skipped when its sibling with output_suffix exists and is at least
+    as new (like make); with output_suffix None nothing is skipped. Outputs are
+    indexed during the same walk. Paths are the scandir entry strings, so callers
+    can key results by them without a Path round trip.
+    """
+    extensions = frozenset(ext.lower() for ext in extensions)
+    matches = _compile_path_filter(path_filter)
+    if output_suffix is None:
+        paths = _walk_files(directory, extensions, recursive=True)
+        return [path for path in paths if matches is None or matches(path)], []
+
+    output_suffix = output_suffix.lower()
+    candidates, outputs = [], set()
+
+    for path in _walk_files(directory, extensions | {output_suffix}, recursive=True):
+        root, suffix = os.path.splitext(path)
+        suffix = suffix.lower()
+        if suffix == output_suffix:
+            outputs.add(root)
+        if suffix in extensions and (matches is None or matches(path)):
+            candidates.append(path)
+
+    pending, skipped = [], []
+    for path in candidates:
+        root = os.path.splitext(path)[0]
+        if root in outputs and _newer_or_same(root + output_suffix, path):
+            skipped.append(path)
+        else:
+            pending.append(path)
+    return pending, skipped
+
+
+def _newer_or_same(output: str, source: str) -> bool:
+    try:
+        return os.stat(output).st_mtime_ns >= os.stat(source).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def index_files(directory: Union[str, Path], extensions: Set[str]) -> Set[str]:
+    """Collect the paths of all files with the given extensions, for existence checks without a stat per file."""
+    return set(_walk_files(directory, extensions, recursive=True))
+
+
+def walk_classified(directory: Union[str, Path], source_extensions: Set[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (path, kind) for every source, markdown and JSON file in a single walk.
+
+    kind is "source", "md" or "json"; a file matching both a source extension
+    and .md/.json is yielded once per kind.
+    """
+    source_extensions = frozenset(ext.lower() for ext in source_extensions)
+    for path in _walk_files(directory, source_extensions | {".md", ".json"}, recursive=True):
+        suffix = os.path.splitext(path)[1].lower()
+        if suffix in source_extensions:
+            yield path, "source"
+        if suffix == ".md":
+            yield path, "md"
+        elif suffix == ".json":
+            yield path, "json"
+
+
+def _walk_files(directory: Union[str, Path], extensions: Set[str], recursive: bool) -> Iterator[str]:
+    """Yield paths of files under directory whose suffix is in extensions."""
     directory = Path(directory)
     if not directory.exists():
         raise FileNotFoundError(f"Directory not found: {directory}")
 
-    pattern = "**/*" if recursive else "*"
-    files = [
-        f for f in directory.glob(pattern)
-        if f.is_file() and f.suffix.lower() in extensions
-    ]
+    # os.scandir reuses the file type from readdir, avoiding a stat per entry
+    extensions = frozenset(ext.lower() for ext in extensions)
+    suffixes = tuple(extensions)
+    stack = [str(directory)]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                # A bare dotfile such as '.pdf' has no suffix, as with Path.suffix
+                if name.endswith(suffixes) and name not in extensions and entry.is_file():
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def write_atomic(path: Union[str, Path], data: bytes) -> None:
+    """Write bytes to path via a uniquely named temporary sibling and os.replace.
+
+    Concurrent writers to the same path (e.g. report.pdf and report.png both
+    converting to report.md) each get their own temporary file. Data goes
+    straight to the file descriptor, without Python's buffered I/O layer.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    # O_EXCL with a unique name; mode 0o666 lets the kernel apply the umask as for any new file
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_text(path: Union[str, Path]) -> str:
+    """
+    Read a UTF-8 text file like Path.read_text, without the text-mode wrapper.
+    Files up to 1 MiB reuse a per-thread buffer; larger ones get a buffer sized from fstat.
+    """
+    text = _read_utf8(path)
+    # Match text-mode universal newlines
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_utf8(path: Union[str, Path]) -> str:
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > _READ_BUFFER_SIZE:
+            # Too big to keep around per thread; allocate once at the final size
+            buf = bytearray(size)
+        else:
+            buf = getattr(_read_buffers, 'buf', None)
+            if buf is None:
+                buf = _read_buffers.buf = bytearray(_READ_BUFFER_SIZE)
+
+        with memoryview(buf) as view:
+            total = 0
+            while total < size:
+                n = f.readinto(view[total:size])
+                if not n:
+                    break
+                total += n
+            # Decode straight from the buffer without an intermediate bytes copy
+            return str(view[:total], 'utf-8')
+
+
+def json_dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON (indented by default), using orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=str).encode('utf-8')
 
-    if path_filter:
-        files = [f for f in files if path_filter.lower() in str(f).lower()]
 
-    return files
\ No newline at end of file
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, using orjson when available. Errors are ValueErrors either way."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
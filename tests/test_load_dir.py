@@ -0,0 +1,19 @@
+import os
+
+from pydantic import BaseModel
+
+from dataset_extraction_tools import load_dir
+
+
+class Result(BaseModel):
+    a: int
+
+
+def test_malformed_file_does_not_shift_later_results(tmp_path):
+    for name, content in [("x", '{"a":1},{"a":99}'), ("y", '{"a":2}'), ("z", '{"a":3}')]:
+        (tmp_path / f"{name}.md").write_text("text")
+        (tmp_path / f"{name}.json").write_text(content)
+
+    results = load_dir(tmp_path, Result)
+
+    assert {os.path.basename(path): model.a for path, model in results.items()} == {"y.json": 2, "z.json": 3}